@@ -14,13 +14,118 @@
 
 """Module to convert MJCF geoms to SDFormat Collision/Visual geometries"""
 
+import itertools
+import math
+
 from ignition.math import Vector2d, Vector3d
 
 import sdformat as sdf
 import sdformat_mjcf_utils.sdf_utils as su
 
-VISUAL_NUMBER = 0
-COLLISION_NUMBER = 0
+# Bind the SDFormat classes and geometry types once to skip the module
+# attribute lookups each time a geometry is built.
+_Geometry = sdf.Geometry
+_Box = sdf.Box
+_Capsule = sdf.Capsule
+_Cylinder = sdf.Cylinder
+_Ellipsoid = sdf.Ellipsoid
+_Sphere = sdf.Sphere
+_Plane = sdf.Plane
+
+_GT_BOX = sdf.GeometryType.BOX
+_GT_CAPSULE = sdf.GeometryType.CAPSULE
+_GT_CYLINDER = sdf.GeometryType.CYLINDER
+_GT_ELLIPSOID = sdf.GeometryType.ELLIPSOID
+_GT_SPHERE = sdf.GeometryType.SPHERE
+_GT_PLANE = sdf.GeometryType.PLANE
+
+_visual_counter = itertools.count()
+_collision_counter = itertools.count()
+
+
+def _build_box(geom):
+    sdf_geometry = _Geometry()
+    box = _Box()
+    size = geom.size
+    box.set_size(Vector3d(size[0] * 2, size[1] * 2, size[2] * 2))
+    sdf_geometry.set_box_shape(box)
+    sdf_geometry.set_type(_GT_BOX)
+    # TODO(ahcorde): Add fromto
+    return sdf_geometry
+
+
+def _build_capsule(geom):
+    sdf_geometry = _Geometry()
+    capsule = _Capsule()
+    capsule.set_radius(geom.size[0])
+    fromto = geom.fromto
+    if fromto is None:
+        capsule.set_length(geom.size[1] * 2)
+    else:
+        dx = fromto[3] - fromto[0]
+        dy = fromto[4] - fromto[1]
+        dz = fromto[5] - fromto[2]
+        capsule.set_length(math.sqrt(dx * dx + dy * dy + dz * dz))
+    sdf_geometry.set_capsule_shape(capsule)
+    sdf_geometry.set_type(_GT_CAPSULE)
+    return sdf_geometry
+
+
+def _build_cylinder(geom):
+    sdf_geometry = _Geometry()
+    cylinder = _Cylinder()
+    cylinder.set_radius(geom.size[0])
+    fromto = geom.fromto
+    if fromto is None:
+        cylinder.set_length(geom.size[1] * 2)
+    else:
+        dx = fromto[3] - fromto[0]
+        dy = fromto[4] - fromto[1]
+        dz = fromto[5] - fromto[2]
+        cylinder.set_length(math.sqrt(dx * dx + dy * dy + dz * dz))
+    sdf_geometry.set_cylinder_shape(cylinder)
+    sdf_geometry.set_type(_GT_CYLINDER)
+    return sdf_geometry
+
+
+def _build_ellipsoid(geom):
+    sdf_geometry = _Geometry()
+    ellipsoid = _Ellipsoid()
+    ellipsoid.set_radii(su.list_to_vec3d(geom.size))
+    sdf_geometry.set_ellipsoid_shape(ellipsoid)
+    sdf_geometry.set_type(_GT_ELLIPSOID)
+    # TODO(ahcorde): Add fromto
+    return sdf_geometry
+
+
+def _build_sphere(geom):
+    sdf_geometry = _Geometry()
+    sphere = _Sphere()
+    sphere.set_radius(geom.size[0])
+    sdf_geometry.set_sphere_shape(sphere)
+    sdf_geometry.set_type(_GT_SPHERE)
+    return sdf_geometry
+
+
+def _build_plane(geom):
+    sdf_geometry = _Geometry()
+    plane = _Plane()
+    size = geom.size
+    plane.set_size(Vector2d(size[0] * 2, size[1] * 2))
+    sdf_geometry.set_plane_shape(plane)
+    sdf_geometry.set_type(_GT_PLANE)
+    return sdf_geometry
+
+
+# Maps MJCF geom types to the functions that build the SDFormat geometry.
+_GEOM_BUILDERS = {
+    "box": _build_box,
+    "capsule": _build_capsule,
+    "cylinder": _build_cylinder,
+    "ellipsoid": _build_ellipsoid,
+    "sphere": _build_sphere,
+    "plane": _build_plane,
+}
 
 
 def mjcf_geom_to_sdf(geom):
@@ -35,76 +140,32 @@ def mjcf_geom_to_sdf(geom):
     # match the longitudinal axis of the capsule/cylinder and its position
     # Related comment:
     # https://github.com/gazebosim/gz-mujoco/pull/26#discussion_r877558075
-    sdf_geometry = sdf.Geometry()
-    if geom.type == "box":
-        box = sdf.Box()
-        box.set_size(su.list_to_vec3d(geom.size) * 2)
-        sdf_geometry.set_box_shape(box)
-        sdf_geometry.set_type(sdf.GeometryType.BOX)
-        # TODO(ahcorde): Add fromto
-    elif geom.type == "capsule":
-        capsule = sdf.Capsule()
-        capsule.set_radius(geom.size[0])
-        if geom.fromto is None:
-            capsule.set_length(geom.size[1] * 2)
-        else:
-            v1 = Vector3d(geom.fromto[0], geom.fromto[1], geom.fromto[2])
-            v2 = Vector3d(geom.fromto[3], geom.fromto[4], geom.fromto[5])
-            length = v1.distance(v2)
-            capsule.set_length(length)
-        sdf_geometry.set_capsule_shape(capsule)
-        sdf_geometry.set_type(sdf.GeometryType.CAPSULE)
-    elif geom.type == "cylinder":
-        cylinder = sdf.Cylinder()
-        cylinder.set_radius(geom.size[0])
-        if geom.fromto is None:
-            cylinder.set_length(geom.size[1] * 2)
-        else:
-            v1 = Vector3d(geom.fromto[0], geom.fromto[1], geom.fromto[2])
-            v2 = Vector3d(geom.fromto[3], geom.fromto[4], geom.fromto[5])
-            length = v1.distance(v2)
-            cylinder.set_length(length)
-        sdf_geometry.set_cylinder_shape(cylinder)
-        sdf_geometry.set_type(sdf.GeometryType.CYLINDER)
-    elif geom.type == "ellipsoid":
-        ellipsoid = sdf.Ellipsoid()
-        ellipsoid.set_radii(su.list_to_vec3d(geom.size))
-        sdf_geometry.set_ellipsoid_shape(ellipsoid)
-        sdf_geometry.set_type(sdf.GeometryType.ELLIPSOID)
-        # TODO(ahcorde): Add fromto
-    elif geom.type == "sphere":
-        sphere = sdf.Sphere()
-        sphere.set_radius(geom.size[0])
-        sdf_geometry.set_sphere_shape(sphere)
-        sdf_geometry.set_type(sdf.GeometryType.SPHERE)
-    elif geom.type == "plane":
-        plane = sdf.Plane()
-        plane.set_size(Vector2d(geom.size[0] * 2, geom.size[1] * 2))
-        sdf_geometry.set_plane_shape(plane)
-        sdf_geometry.set_type(sdf.GeometryType.PLANE)
-    else:
+    builder = _GEOM_BUILDERS.get(geom.type)
+    if builder is None:
         raise RuntimeError(
             f"Encountered unsupported shape type {geom.type}")
-    return sdf_geometry
+    return builder(geom)
 
 
-def mjcf_visual_to_sdf(geom):
+def mjcf_visual_to_sdf(geom, sdf_geometry=None):
     """
     Converts MJCF geom to a SDFormat visual
     MJCF geom should be part of group `VISUAL_GEOM_GROUP`.
 
     :param mjcf.Element geom: The MJCF geom.
+    :param sdf.Geometry sdf_geometry: (Optional) Geometry already converted
+    from `geom`, e.g. when the same geom also produces a collision. If None,
+    `geom` is converted.
     :return: The newly created SDFormat visual.
     :rtype: sdformat.Visual
     """
     visual = sdf.Visual()
     if geom.name is not None:
-        visual.set_name("visual_" + geom.name)
+        visual.set_name(f"visual_{geom.name}")
     else:
-        global VISUAL_NUMBER
-        visual.set_name("unnamed_visual_" + str(VISUAL_NUMBER))
-        VISUAL_NUMBER = VISUAL_NUMBER + 1
-    sdf_geometry = mjcf_geom_to_sdf(geom)
+        visual.set_name(f"unnamed_visual_{next(_visual_counter)}")
+    if sdf_geometry is None:
+        sdf_geometry = mjcf_geom_to_sdf(geom)
     if sdf_geometry is not None:
         visual.set_geometry(sdf_geometry)
     else:
@@ -112,23 +173,25 @@ def mjcf_visual_to_sdf(geom):
     return visual
 
 
-def mjcf_collision_to_sdf(geom):
+def mjcf_collision_to_sdf(geom, sdf_geometry=None):
     """
     Converts MJCF geom to a SDFormat collision
     MJCF geom should be part of group `COLLISION_GEOM_GROUP`.
 
     :param mjcf.Element geom: The MJCF geom.
+    :param sdf.Geometry sdf_geometry: (Optional) Geometry already converted
+    from `geom`, e.g. when the same geom also produces a visual. If None,
+    `geom` is converted.
     :return: The newly created SDFormat collision.
     :rtype: sdformat.Collision
     """
     col = sdf.Collision()
     if geom.name is not None:
-        col.set_name("collision_" + geom.name)
+        col.set_name(f"collision_{geom.name}")
     else:
-        global COLLISION_NUMBER
-        col.set_name("unnamed_collision_" + str(COLLISION_NUMBER))
-        COLLISION_NUMBER = COLLISION_NUMBER + 1
-    sdf_geometry = mjcf_geom_to_sdf(geom)
+        col.set_name(f"unnamed_collision_{next(_collision_counter)}")
+    if sdf_geometry is None:
+        sdf_geometry = mjcf_geom_to_sdf(geom)
     if sdf_geometry is not None:
         col.set_geometry(sdf_geometry)
     else:
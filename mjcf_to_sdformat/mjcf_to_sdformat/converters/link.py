@@ -15,7 +15,8 @@
 from ignition.math import (Inertiald, MassMatrix3d, Vector3d, Pose3d,
                            Quaterniond)
 
-from mjcf_to_sdformat.converters.geometry import (mjcf_visual_to_sdf,
+from mjcf_to_sdformat.converters.geometry import (mjcf_geom_to_sdf,
+                                                  mjcf_visual_to_sdf,
                                                   mjcf_collision_to_sdf)
 from mjcf_to_sdformat.converters.light import mjcf_light_to_sdf
 
@@ -153,8 +154,8 @@ def mjcf_body_to_sdf(body, physics, body_parent_name=None, modifiers=None):
         else:
             return su.get_pose_from_mjcf(geom).pos()
 
-    def set_visual(geom):
-        visual = mjcf_visual_to_sdf(geom)
+    def set_visual(geom, sdf_geometry=None):
+        visual = mjcf_visual_to_sdf(geom, sdf_geometry)
         if visual is not None:
             visual.set_name(su.prefix_name_with_index(
                 "visual", geom.name, NUMBER_OF_VISUAL))
@@ -162,8 +163,8 @@ def mjcf_body_to_sdf(body, physics, body_parent_name=None, modifiers=None):
             visual.set_raw_pose(pose)
             link.add_visual(visual)
 
-    def set_collision(geom):
-        col = mjcf_collision_to_sdf(geom)
+    def set_collision(geom, sdf_geometry=None):
+        col = mjcf_collision_to_sdf(geom, sdf_geometry)
         if col is not None:
             col.set_name(su.prefix_name_with_index(
                 "collision", geom.name, NUMBER_OF_COLLISION))
@@ -176,8 +177,11 @@ def mjcf_body_to_sdf(body, physics, body_parent_name=None, modifiers=None):
             modifiers.apply_modifiers_to_element(geom)
         # If the group is not defined then visual and collision is added
         if geom.group is None:
-            set_visual(geom)
-            set_collision(geom)
+            # The visual and the collision copy the geometry, so it only
+            # needs to be converted once.
+            sdf_geometry = mjcf_geom_to_sdf(geom)
+            set_visual(geom, sdf_geometry)
+            set_collision(geom, sdf_geometry)
         elif geom.group == VISUAL_GEOM_GROUP:
             set_visual(geom)
         elif geom.group == COLLISION_GEOM_GROUP:
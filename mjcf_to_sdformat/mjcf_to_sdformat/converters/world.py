@@ -25,6 +25,37 @@ from sdformat_mjcf_utils.defaults import MjcfModifiers
 
 import sdformat as sdf
 
+# System plugins added to the world when `export_world_plugins` is set, as
+# (filename, name) pairs.
+_WORLD_PLUGINS = (
+    ("ignition-gazebo-physics-system",
+     "ignition::gazebo::systems::Physics"),
+    ("ignition-gazebo-sensors-system",
+     "ignition::gazebo::systems::Sensors"),
+    ("ignition-gazebo-user-commands-system",
+     "ignition::gazebo::systems::UserCommands"),
+    ("ignition-gazebo-scene-broadcaster-system",
+     "ignition::gazebo::systems::SceneBroadcaster"),
+)
+
+# The sdf.Plugin objects built from _WORLD_PLUGINS. They are created on first
+# use and shared across worlds, since World.add_plugin stores a copy.
+_WORLD_PLUGIN_OBJS = None
+
+
+def _get_world_plugins():
+    """
+    Get the system plugins exported with each world.
+
+    :return: The SDFormat plugins.
+    :rtype: tuple[sdf.Plugin]
+    """
+    global _WORLD_PLUGIN_OBJS
+    if _WORLD_PLUGIN_OBJS is None:
+        _WORLD_PLUGIN_OBJS = tuple(sdf.Plugin(filename, name)
+                                   for filename, name in _WORLD_PLUGINS)
+    return _WORLD_PLUGIN_OBJS
+
 
 def mjcf_worldbody_to_sdf(mjcf_root, physics, world,
                           export_world_plugins=False):
@@ -45,19 +76,21 @@ def mjcf_worldbody_to_sdf(mjcf_root, physics, world,
         model.set_name("model")
 
     modifiers = MjcfModifiers(mjcf_root)
+    apply_modifiers = modifiers.apply_modifiers_to_element
+    worldbody = mjcf_root.worldbody
+    option = mjcf_root.option
 
     model_static = sdf.Model()
 
-    for light in mjcf_root.worldbody.light:
-        modifiers.apply_modifiers_to_element(light)
+    for light in worldbody.light:
+        apply_modifiers(light)
         light_sdf = mjcf_light_to_sdf(light)
         world.add_light(light_sdf)
 
-    link = mjcf_body_to_sdf(mjcf_root.worldbody, physics, modifiers=modifiers)
-    model_static.set_name(su.find_unique_name(
-        mjcf_root.worldbody, "geom", "static"))
+    link = mjcf_body_to_sdf(worldbody, physics, modifiers=modifiers)
+    model_static.set_name(su.find_unique_name(worldbody, "geom", "static"))
 
-    for camera in mjcf_root.worldbody.camera:
+    for camera in worldbody.camera:
         sensor = mjcf_camera_sensor_to_sdf(camera)
         if sensor is not None:
             link.add_sensor(sensor)
@@ -66,64 +99,52 @@ def mjcf_worldbody_to_sdf(mjcf_root, physics, world,
     model_static.set_static(True)
     world.add_model(model_static)
 
-    body = mjcf_root.worldbody.body
-
-    if mjcf_root.option is not None:
-        if mjcf_root.option.flag.gravity == "disable":
+    if option is not None:
+        if option.flag.gravity == "disable":
             world.set_gravity(Vector3d(0, 0, 0))
-        elif mjcf_root.option.gravity is not None:
-            world.set_gravity(su.list_to_vec3d(mjcf_root.option.gravity))
-        if mjcf_root.option.magnetic is not None:
-            world.set_magnetic_field(
-                su.list_to_vec3d(mjcf_root.option.magnetic))
-        if mjcf_root.option.wind is not None:
-            world.set_wind_linear_velocity(
-                su.list_to_vec3d(mjcf_root.option.wind))
-
-    def iterate_bodies(input_body,
-                       model,
-                       body_parent_name=None):
-        for body in input_body:
-            link = mjcf_body_to_sdf(body,
-                                    physics,
-                                    body_parent_name=body_parent_name,
-                                    modifiers=modifiers)
-            for camera in body.camera:
-                sensor = mjcf_camera_sensor_to_sdf(camera)
-                if sensor is not None:
-                    link.add_sensor(sensor)
-
-            for joint in body.joint:
-                if modifiers is not None:
-                    modifiers.apply_modifiers_to_element(joint)
-                joint_sdf = mjcf_joint_to_sdf(joint,
-                                              body_parent_name,
-                                              body.name)
-                if joint_sdf is not None:
-                    model.add_joint(joint_sdf)
-            if len(body.joint) == 0 and body.freejoint is None:
-                joint_sdf = add_fixed_joint(body_parent_name, body.name)
-                model.add_joint(joint_sdf)
-
-            model.add_link(link)
-            iterate_bodies(body.body,
-                           model,
-                           body.name)
-    iterate_bodies(body, model)
+        elif option.gravity is not None:
+            g = option.gravity
+            world.set_gravity(Vector3d(g[0], g[1], g[2]))
+        if option.magnetic is not None:
+            m = option.magnetic
+            world.set_magnetic_field(Vector3d(m[0], m[1], m[2]))
+        if option.wind is not None:
+            w = option.wind
+            world.set_wind_linear_velocity(Vector3d(w[0], w[1], w[2]))
+
+    # Walk the body tree depth-first with an explicit stack so that deeply
+    # nested models are not bounded by the interpreter's recursion limit.
+    add_joint = model.add_joint
+    add_link = model.add_link
+    camera_to_sdf = mjcf_camera_sensor_to_sdf
+    stack = [(child, None) for child in reversed(worldbody.body)]
+    while stack:
+        body, body_parent_name = stack.pop()
+        link = mjcf_body_to_sdf(body,
+                                physics,
+                                body_parent_name=body_parent_name,
+                                modifiers=modifiers)
+        for camera in body.camera:
+            sensor = camera_to_sdf(camera)
+            if sensor is not None:
+                link.add_sensor(sensor)
+
+        for joint in body.joint:
+            apply_modifiers(joint)
+            joint_sdf = mjcf_joint_to_sdf(joint,
+                                          body_parent_name,
+                                          body.name)
+            if joint_sdf is not None:
+                add_joint(joint_sdf)
+        if len(body.joint) == 0 and body.freejoint is None:
+            joint_sdf = add_fixed_joint(body_parent_name, body.name)
+            add_joint(joint_sdf)
+
+        add_link(link)
+        stack.extend((child, body.name) for child in reversed(body.body))
 
     if export_world_plugins:
-        plugins = {
-            "ignition-gazebo-physics-system":
-                "ignition::gazebo::systems::Physics",
-            "ignition-gazebo-sensors-system":
-                "ignition::gazebo::systems::Sensors",
-            "ignition-gazebo-user-commands-system":
-                "ignition::gazebo::systems::UserCommands",
-            "ignition-gazebo-scene-broadcaster-system":
-                "ignition::gazebo::systems::SceneBroadcaster"
-        }
-        for [key, value] in plugins.items():
-            plugin = sdf.Plugin(key, value)
+        for plugin in _get_world_plugins():
             world.add_plugin(plugin)
 
     world.add_model(model)
@@ -0,0 +1,67 @@
+# Copyright (C) 2022 Open Source Robotics Foundation
+
+# Licensed under the Apache License, version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#       http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import sdformat as sdf
+from dm_control import mjcf
+
+from mjcf_to_sdformat.converters import geometry as geometry_conv
+from mjcf_to_sdformat.converters.link import mjcf_body_to_sdf
+
+
+class BodyGeometryTest(unittest.TestCase):
+    def test_ungrouped_geom_visual_and_collision(self):
+        radius = 5.
+
+        mujoco = mjcf.RootElement(model="test")
+        body = mujoco.worldbody.add('body', name="body")
+        body.add('geom', type="sphere", name="sphere", size=[radius])
+        physics = mjcf.Physics.from_mjcf_model(mujoco)
+
+        link = mjcf_body_to_sdf(body, physics)
+        self.assertEqual(1, link.visual_count())
+        self.assertEqual(1, link.collision_count())
+
+        visual = link.visual_by_index(0)
+        col = link.collision_by_index(0)
+        for sdf_geom in [visual.geometry(), col.geometry()]:
+            self.assertEqual(sdf.GeometryType.SPHERE, sdf_geom.type())
+            self.assertNotEqual(None, sdf_geom.sphere_shape())
+            self.assertEqual(radius, sdf_geom.sphere_shape().radius())
+
+    def test_shared_geometry_is_copied(self):
+        radius = 5.
+
+        mujoco = mjcf.RootElement(model="test")
+        body = mujoco.worldbody.add('body', name="body")
+        geom = body.add('geom', type="sphere", name="sphere", size=[radius])
+
+        # mjcf_body_to_sdf hands the same geometry to the visual and the
+        # collision of an ungrouped geom, so both must keep their own copy.
+        sdf_geometry = geometry_conv.mjcf_geom_to_sdf(geom)
+        visual = geometry_conv.mjcf_visual_to_sdf(geom, sdf_geometry)
+        col = geometry_conv.mjcf_collision_to_sdf(geom, sdf_geometry)
+
+        sphere = sdf.Sphere()
+        sphere.set_radius(1.)
+        sdf_geometry.set_sphere_shape(sphere)
+        self.assertEqual(1., sdf_geometry.sphere_shape().radius())
+
+        self.assertEqual(radius, visual.geometry().sphere_shape().radius())
+        self.assertEqual(radius, col.geometry().sphere_shape().radius())
+
+
+if __name__ == "__main__":
+    unittest.main()
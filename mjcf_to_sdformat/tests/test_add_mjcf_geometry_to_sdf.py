@@ -170,6 +170,23 @@ class VisualTest(unittest.TestCase):
         self.assertNotEqual(None, sdf_geom.sphere_shape())
         self.assertEqual(radius, sdf_geom.sphere_shape().radius())
 
+    def test_visual_and_collision_share_geometry(self):
+        radius = 5.
+
+        mujoco = mjcf.RootElement(model="test")
+        body = mujoco.worldbody.add('body')
+        geom = body.add('geom',
+                        type="sphere",
+                        size=[radius])
+        sdf_geometry = geometry_conv.mjcf_geom_to_sdf(geom)
+        sdf_visual = geometry_conv.mjcf_visual_to_sdf(geom, sdf_geometry)
+        sdf_col = geometry_conv.mjcf_collision_to_sdf(geom, sdf_geometry)
+
+        for sdf_geom in [sdf_visual.geometry(), sdf_col.geometry()]:
+            self.assertEqual(sdf.GeometryType.SPHERE, sdf_geom.type())
+            self.assertNotEqual(None, sdf_geom.sphere_shape())
+            self.assertEqual(radius, sdf_geom.sphere_shape().radius())
+
 
 class CollisionTest(unittest.TestCase):
     def test_basic_collision_attributes(self):
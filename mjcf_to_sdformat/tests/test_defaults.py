@@ -14,11 +14,18 @@
 
 import unittest
 
+from numpy.testing import assert_allclose
+
 from dm_control import mjcf
 from dm_control import mujoco
 
+from ignition.math import Color
+
+from mjcf_to_sdformat.converters.link import mjcf_body_to_sdf
 from mjcf_to_sdformat.converters.world import mjcf_worldbody_to_sdf
 
+from sdformat_mjcf_utils.defaults import MjcfModifiers
+
 import sdformat as sdf
 
 from tests.helpers import TEST_RESOURCES_DIR
@@ -135,5 +142,57 @@ class DefaultsTest(unittest.TestCase):
         self.assertEqual(0.5, shape6_sphere.radius())
 
 
+class MjcfModifiersTest(unittest.TestCase):
+
+    def test_defaults_not_reapplied_after_first_call(self):
+        mjcf_model = mjcf.RootElement(model="test")
+        mjcf_model.default.geom.rgba = [1, 0, 0, 1]
+        geom = mjcf_model.worldbody.add("geom", type="sphere", size=[1])
+
+        modifiers = MjcfModifiers(mjcf_model)
+        modifiers.apply_modifiers_to_element(geom)
+        assert_allclose([1, 0, 0, 1], geom.rgba)
+
+        # The element was already processed, so changes to its default class
+        # are not picked up by a second call.
+        mjcf_model.default.geom.rgba = [0, 1, 0, 1]
+        modifiers.apply_modifiers_to_element(geom)
+        assert_allclose([1, 0, 0, 1], geom.rgba)
+
+    def test_worldbody_light_applied_once(self):
+        mjcf_model = mjcf.RootElement(model="test")
+        mjcf_model.default.light.diffuse = [0.2, 0.4, 0.6]
+        light = mjcf_model.worldbody.add("light", name="lamp")
+        physics = mjcf.Physics.from_mjcf_model(mjcf_model)
+        expected_diffuse = Color(0.2, 0.4, 0.6)
+
+        # mjcf_worldbody_to_sdf applies the defaults to the worldbody lights
+        # and then converts the worldbody itself, which visits the same
+        # lights again.
+        modifiers = MjcfModifiers(mjcf_model)
+        modifiers.apply_modifiers_to_element(light)
+        self.assertIn(id(light), modifiers._applied)
+        num_applied = len(modifiers._applied)
+
+        link = mjcf_body_to_sdf(mjcf_model.worldbody, physics,
+                                modifiers=modifiers)
+        self.assertIn(id(light), modifiers._applied)
+        # Only the light was processed; the worldbody has no geoms.
+        self.assertEqual(num_applied, len(modifiers._applied))
+        self.assertEqual(1, link.light_count())
+        self.assertEqual(expected_diffuse, link.light_by_index(0).diffuse())
+
+        world = sdf.World()
+        world.set_name("default")
+        mjcf_worldbody_to_sdf(mjcf_model, physics, world)
+
+        self.assertEqual(1, world.light_count())
+        self.assertEqual(expected_diffuse, world.light_by_index(0).diffuse())
+        static_link = world.model_by_index(0).link_by_index(0)
+        self.assertEqual(1, static_link.light_count())
+        self.assertEqual(expected_diffuse,
+                         static_link.light_by_index(0).diffuse())
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -28,14 +28,27 @@ class MjcfModifiers:
         :param mjcf.RootElement root: The MJCF root element
         """
         self.root = root
+        # Elements that already had their defaults applied, keyed by id. The
+        # elements are kept as values so that their ids cannot be reused.
+        self._applied = {}
         self._apply_inherited_default(self.root.default, None)
 
     def apply_modifiers_to_element(self, elem):
         """
         Given an element, e.g., geom, body, etc, this copies into the element
         the attributes of the default class associated with the element.
+        Applying the defaults is idempotent, so elements that have already
+        been processed are skipped. As a consequence, the element must not be
+        re-classed (e.g. by changing its `dclass`) or have its default class
+        modified after the first call, since those changes will not be
+        applied. Processed elements are kept alive for the lifetime of this
+        instance.
         :param mjcf.Element elem: The MJCF element to process.
         """
+        elem_id = id(elem)
+        if elem_id in self._applied:
+            return
+        self._applied[elem_id] = elem
         dclass = self._get_default_class(elem)
         def_elem = dclass.get_children(elem.tag)
         self._copy_attributes(def_elem, elem)
@@ -183,6 +183,8 @@ def find_unique_name(elem, namespace, name):
     where `body` is the MJCF body to which the geom is being added. If the body
     already has "bumper", the returned name would be "bumper_0".
 
+    When the provided name is not taken, it is returned after a single lookup
+    in the namescope, so callers do not need to check for uniqueness first.
 
     :param mjcf.Element elem: The element whose namescope is used for checking
     name uniqueness.
@@ -16,6 +16,7 @@ import unittest
 
 import sdformat as sdf
 from ignition.math import Pose3d, Vector3d
+from dm_control import mjcf
 
 from tests import helpers
 import sdformat_mjcf_utils.sdf_utils as su
@@ -54,5 +55,25 @@ class GraphResolverTest(unittest.TestCase):
             self.assertEqual(self.test_xyz, xyz)
 
 
+class FindUniqueNameTest(unittest.TestCase):
+
+    def test_unused_name(self):
+        mujoco = mjcf.RootElement(model="test")
+        self.assertEqual("static",
+                         su.find_unique_name(mujoco.worldbody, "geom",
+                                             "static"))
+
+    def test_name_collision(self):
+        mujoco = mjcf.RootElement(model="test")
+        mujoco.worldbody.add("geom", name="static", size=[1])
+        self.assertEqual("static_0",
+                         su.find_unique_name(mujoco.worldbody, "geom",
+                                             "static"))
+        mujoco.worldbody.add("geom", name="static_0", size=[1])
+        self.assertEqual("static_1",
+                         su.find_unique_name(mujoco.worldbody, "geom",
+                                             "static"))
+
+
 if __name__ == "__main__":
     unittest.main()
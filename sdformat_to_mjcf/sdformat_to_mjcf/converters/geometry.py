@@ -16,11 +16,89 @@
 
 import os
 
+import sdformat as sdf
 import sdformat_mjcf_utils.sdf_utils as su
 
 COLLISION_GEOM_GROUP = 3
 VISUAL_GEOM_GROUP = 0
 
+# Euler angles of the identity rotation. A tuple is used so that the shared
+# value cannot be modified through the geom it is assigned to.
+_ZERO_EULER = (0.0, 0.0, 0.0)
+
+
+def _add_box(geom, sdf_geom):
+    box_shape = sdf_geom.box_shape()
+    geom.type = "box"
+    geom.size = su.vec3d_to_list(box_shape.size() / 2.0)
+
+
+def _add_capsule(geom, sdf_geom):
+    capsule_shape = sdf_geom.capsule_shape()
+    geom.type = "capsule"
+    geom.size = [capsule_shape.radius(), capsule_shape.length() / 2.0]
+
+
+def _add_cylinder(geom, sdf_geom):
+    cylinder_shape = sdf_geom.cylinder_shape()
+    geom.type = "cylinder"
+    geom.size = [cylinder_shape.radius(), cylinder_shape.length() / 2.0]
+
+
+def _add_ellipsoid(geom, sdf_geom):
+    ellipsoid_shape = sdf_geom.ellipsoid_shape()
+    geom.type = "ellipsoid"
+    geom.size = su.vec3d_to_list(ellipsoid_shape.radii())
+
+
+def _add_plane(geom, sdf_geom):
+    plane_shape = sdf_geom.plane_shape()
+    geom.type = "plane"
+    # The third element of size defines the spacing between square grid
+    # lines for rendering.
+    # TODO (azeey) Consider making this configurable
+    geom.size = su.vec2d_to_list(plane_shape.size() / 2.0) + [1]
+
+
+def _add_sphere(geom, sdf_geom):
+    sphere_shape = sdf_geom.sphere_shape()
+    geom.type = "sphere"
+    geom.size = [sphere_shape.radius()]
+
+
+def _add_mesh(geom, sdf_geom):
+    mesh_shape = sdf_geom.mesh_shape()
+    uri = mesh_shape.uri()
+    extension_tokens = os.path.basename(uri).split(".")
+    if (len(extension_tokens) == 1):
+        raise RuntimeError("Unable to find the mesh extension {}"
+                           .format(uri))
+    file_without_extension = os.path.splitext(
+        os.path.basename(uri))[0]
+    if 'http://' in uri or 'https://' in uri:
+        raise RuntimeError("Fuel meshes are not yet supported")
+    geom.type = "mesh"
+    asset_loaded = geom.root.asset.find('mesh', file_without_extension)
+    dirname = os.path.dirname(mesh_shape.file_path())
+    mesh_file_path = os.path.join(dirname, uri)
+    if asset_loaded is None:
+        geom.mesh = geom.root.asset.add('mesh',
+                                        file=mesh_file_path)
+    else:
+        geom.mesh = asset_loaded
+
+
+# Maps SDFormat geometry types to the functions that fill in the MJCF geom.
+_SHAPE_HANDLERS = {
+    sdf.GeometryType.BOX: _add_box,
+    sdf.GeometryType.CAPSULE: _add_capsule,
+    sdf.GeometryType.CYLINDER: _add_cylinder,
+    sdf.GeometryType.ELLIPSOID: _add_ellipsoid,
+    sdf.GeometryType.PLANE: _add_plane,
+    sdf.GeometryType.SPHERE: _add_sphere,
+    sdf.GeometryType.MESH: _add_mesh,
+}
+
 
 def add_geometry(body, name, pose, sdf_geom):
     """
@@ -37,63 +115,27 @@ def add_geometry(body, name, pose, sdf_geom):
 
     if sdf_geom is None:
         return
+    shape_type = sdf_geom.type()
+    handler = _SHAPE_HANDLERS.get(shape_type)
+    if handler is None:
+        raise RuntimeError(
+            f"Encountered unsupported shape type {shape_type}")
+
+    rot = pose.rot()
+    # Most geoms are not rotated, so skip the Euler conversion for those.
+    if rot.w() == 1.0 and rot.x() == rot.y() == rot.z() == 0.0:
+        euler = _ZERO_EULER
+    else:
+        euler = su.quat_to_euler_list(rot)
+
     geom = body.add(
         "geom",
         name=su.find_unique_name(body, "geom", name),
         pos=su.vec3d_to_list(pose.pos()),
-        euler=su.quat_to_euler_list(pose.rot()),
+        euler=euler,
     )
 
-    if sdf_geom.box_shape():
-        box_shape = sdf_geom.box_shape()
-        geom.type = "box"
-        geom.size = su.vec3d_to_list(box_shape.size() / 2.0)
-    elif sdf_geom.capsule_shape():
-        capsule_shape = sdf_geom.capsule_shape()
-        geom.type = "capsule"
-        geom.size = [capsule_shape.radius(), capsule_shape.length() / 2.0]
-    elif sdf_geom.cylinder_shape():
-        cylinder_shape = sdf_geom.cylinder_shape()
-        geom.type = "cylinder"
-        geom.size = [cylinder_shape.radius(), cylinder_shape.length() / 2.0]
-    elif sdf_geom.ellipsoid_shape():
-        ellipsoid_shape = sdf_geom.ellipsoid_shape()
-        geom.type = "ellipsoid"
-        geom.size = su.vec3d_to_list(ellipsoid_shape.radii())
-    elif sdf_geom.plane_shape():
-        plane_shape = sdf_geom.plane_shape()
-        geom.type = "plane"
-        # The third element of size defines the spacing between square grid
-        # lines for rendering.
-        # TODO (azeey) Consider making this configurable
-        geom.size = su.vec2d_to_list(plane_shape.size() / 2.0) + [1]
-    elif sdf_geom.sphere_shape():
-        sphere_shape = sdf_geom.sphere_shape()
-        geom.type = "sphere"
-        geom.size = [sphere_shape.radius()]
-    elif sdf_geom.mesh_shape():
-        mesh_shape = sdf_geom.mesh_shape()
-        uri = mesh_shape.uri()
-        extension_tokens = os.path.basename(mesh_shape.uri()).split(".")
-        if (len(extension_tokens) == 1):
-            raise RuntimeError("Unable to find the mesh extension {}"
-                               .format(uri))
-        file_without_extension = os.path.splitext(
-            os.path.basename(mesh_shape.uri()))[0]
-        if 'http://' in uri or 'https://' in uri:
-            raise RuntimeError("Fuel meshes are not yet supported")
-        geom.type = "mesh"
-        asset_loaded = geom.root.asset.find('mesh', file_without_extension)
-        dirname = os.path.dirname(mesh_shape.file_path())
-        mesh_file_path = os.path.join(dirname, uri)
-        if asset_loaded is None:
-            geom.mesh = geom.root.asset.add('mesh',
-                                            file=mesh_file_path)
-        else:
-            geom.mesh = asset_loaded
-    else:
-        raise RuntimeError(
-            f"Encountered unsupported shape type {sdf_geom.type()}")
+    handler(geom, sdf_geom)
 
     return geom
 
@@ -1,28 +1,12 @@
 # -*- coding: utf-8 -*-
 
-from setuptools import setup, find_packages
-import pathlib
-
-here = pathlib.Path(__file__).parent.resolve()
-long_description = (here / "README.md").read_text(encoding="utf-8")
-license_content = (here / "LICENSE").read_text(encoding="utf-8")
-
+# All other package metadata lives in pyproject.toml. This shim is kept for
+# tooling that still invokes setup.py directly (e.g. `setup.py check`), and to
+# set the Home-page field on older setuptools releases, which only map
+# [project.urls] to Project-URL. Newer releases derive Home-page from the
+# "Homepage" entry of [project.urls] and ignore this argument.
+from setuptools import setup
 
 setup(
-    name='sdformat_to_mjcf',
-    version='0.0.1',
-    description='Tool to convert MJCF file to SDFormat',
-    long_description=long_description,
-    long_description_content_type="text/markdown",
-    author='Open Robotics',
-    author_email='info@openrobotics.org',
     url='https://github.com/gazebosim/gz-mujoco',
-    license=license_content,
-    packages=find_packages(exclude=('tests', 'docs')),
-    test_suite='tests',
-    entry_points={
-        'console_scripts': [
-            'sdformat2mjcf = sdformat_to_mjcf.cli:main',
-        ],
-    },
 )
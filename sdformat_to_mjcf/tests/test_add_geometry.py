@@ -25,6 +25,7 @@ from dm_control import mjcf
 from tests import helpers
 from sdformat_to_mjcf.converters import geometry as geometry_conv
 from sdformat_to_mjcf.converters.root import add_root
+import sdformat_mjcf_utils.sdf_utils as su
 
 
 class GeometryTest(helpers.TestCase):
@@ -178,6 +179,44 @@ class GeometryTest(helpers.TestCase):
         assert_allclose(self.expected_pos, mj_geom.pos)
         assert_allclose(self.expected_euler, mj_geom.euler)
 
+    def _box_geometry(self):
+        geometry = sdf.Geometry()
+        geometry.set_box_shape(sdf.Box())
+        geometry.set_type(sdf.GeometryType.BOX)
+        return geometry
+
+    def test_identity_rotation(self):
+        mujoco = mjcf.RootElement(model="test")
+        body = mujoco.worldbody.add('body')
+        mj_geom = geometry_conv.add_geometry(body, "box_shape",
+                                             Pose3d(1, 2, 3, 0, 0, 0),
+                                             self._box_geometry())
+        assert_allclose(self.expected_pos, mj_geom.pos)
+        assert_allclose([0, 0, 0], mj_geom.euler)
+
+    def test_rotation(self):
+        mujoco = mjcf.RootElement(model="test")
+        body = mujoco.worldbody.add('body')
+        mj_geom = geometry_conv.add_geometry(body, "box_shape",
+                                             self.test_pose,
+                                             self._box_geometry())
+        assert_allclose(su.quat_to_euler_list(self.test_pose.rot()),
+                        mj_geom.euler)
+
+    def test_empty_type(self):
+        # The geometry type, not the shape that happens to be set, determines
+        # how the geometry is converted.
+        geometry = sdf.Geometry()
+        geometry.set_box_shape(sdf.Box())
+        self.assertEqual(sdf.GeometryType.EMPTY, geometry.type())
+
+        mujoco = mjcf.RootElement(model="test")
+        body = mujoco.worldbody.add('body')
+        with self.assertRaises(RuntimeError):
+            geometry_conv.add_geometry(body, "empty_shape", self.test_pose,
+                                       geometry)
+        self.assertEqual(0, len(body.geom))
+
 
 class CollisionTest(helpers.TestCase):
 